@@ -2,54 +2,82 @@
 """
 Jira Comment Adder
 
-Add a comment to an existing Jira issue.
+Add a comment to one or more existing Jira issues.
+
+Usage:
+    python addComment.py                                  # interactive
+    python addComment.py --keys KAN-1,KAN-2 --comment "Deployed to staging"
+    python addComment.py --keys KAN-1,KAN-2 --comment @release-notes.txt
+    python addComment.py --keys KAN-1 --comment "@@team deployed"   # literal @
+    cat keys.txt | python addComment.py --keys - --comment "Deployed to staging"
 """
 
-import os
-import requests
-from requests.auth import HTTPBasicAuth
-from dotenv import load_dotenv
+import argparse
+from config import settings
+from jira_cli import read_keys, reads_stdin
+from jira_http import SESSION, adf_doc, batch_fetch, dumps
+
+def read_comment(value):
+    """
+    Return the comment text, loading it from a file when given as @path.
+
+    A leading "@@" stands for a literal "@". Raises OSError or
+    UnicodeDecodeError if the file cannot be read.
+    """
+    if value.startswith('@@'):
+        return value[1:].strip()
+    if value.startswith('@'):
+        with open(value[1:], encoding='utf-8') as f:
+            return f.read().strip()
+    return value.strip()
+
+def add_comment(jira_url, issue_key, body):
+    """Post the pre-encoded comment body to a single issue."""
+    url = f"{jira_url}/rest/api/3/issue/{issue_key}/comment"
+    return SESSION.post(url, data=body)
 
 def main():
-    load_dotenv()
-    jira_url = os.getenv('JIRA_URL').rstrip('/')
-    email = os.getenv('JIRA_EMAIL')
-    api_token = os.getenv('JIRA_API_TOKEN')
+    parser = argparse.ArgumentParser(description="Add a comment to Jira issues.")
+    parser.add_argument("--keys", help="Comma-separated issue keys (e.g., KAN-1,KAN-2); \"-\" reads them from stdin")
+    parser.add_argument("--comment", help="Comment text, or @file.txt to read it from a file (@@ for a literal @)")
+    args = parser.parse_args()
+
+    jira_url = settings().jira_url
 
-    issue_key = input("Enter issue key (e.g., KAN-1): ").strip().upper()
-    comment_text = input("Enter comment: ").strip()
+    key_args = args.keys.split(',') if args.keys else []
+    if reads_stdin(key_args) and not args.comment:
+        # stdin is consumed by the keys, so the comment cannot be prompted for
+        parser.error("--comment is required when keys are piped on stdin")
 
-    if not all([issue_key, comment_text]):
+    issue_keys = read_keys(key_args, parser)
+    if not issue_keys:
+        issue_key = input("Enter issue key (e.g., KAN-1): ").strip().upper()
+        issue_keys = [issue_key] if issue_key else []
+    try:
+        comment_text = read_comment(args.comment) if args.comment else input("Enter comment: ").strip()
+    except (OSError, UnicodeDecodeError) as e:
+        parser.error(f"cannot read comment file: {e} (use @@ for a literal '@')")
+
+    if not all([issue_keys, comment_text]):
         print("❌ Error: Issue key and comment text are required.")
         return
 
-    url = f"{jira_url}/rest/api/3/issue/{issue_key}/comment"
-    
-    payload = {
-        "body": {
-            "type": "doc",
-            "version": 1,
-            "content": [
-                {
-                    "type": "paragraph",
-                    "content": [{"type": "text", "text": comment_text}]
-                }
-            ]
-        }
-    }
-
-    response = requests.post(
-        url,
-        auth=HTTPBasicAuth(email, api_token),
-        headers={"Content-Type": "application/json", "Accept": "application/json"},
-        json=payload
+    # The body is identical for every issue, so encode it only once
+    body = dumps({"body": adf_doc(comment_text)})
+    responses, errors = batch_fetch(
+        issue_keys, lambda k: add_comment(jira_url, k, body), max_workers=8
     )
 
-    if response.status_code == 201:
-        print(f"✅ Comment added to {issue_key}")
-    else:
-        print(f"❌ Failed to add comment: {response.status_code}")
-        print(response.text)
+    for issue_key in issue_keys:
+        if issue_key in errors:
+            print(f"❌ Failed to add comment to {issue_key}: {errors[issue_key]}")
+            continue
+        response = responses[issue_key]
+        if response.status_code == 201:
+            print(f"✅ Comment added to {issue_key}")
+        else:
+            print(f"❌ Failed to add comment to {issue_key}: {response.status_code}")
+            print(response.text)
 
 if __name__ == "__main__":
     main()
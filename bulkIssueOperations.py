@@ -2,28 +2,51 @@
 """
 Jira Bulk Issue Creator
 
-Demonstrates creating multiple issues in a single request.
+Demonstrates creating multiple issues in a single request. Jira accepts
+at most 50 issues per bulk-create call, so larger batches are split.
 """
 
-import os
+import sys
 import json
-import requests
-from requests.auth import HTTPBasicAuth
-from dotenv import load_dotenv
+from config import settings
+from jira_http import SESSION, batch_fetch, dumps, loads
+
+# Jira's limit on issueUpdates per /issue/bulk request
+BULK_LIMIT = 50
+MAX_ISSUES = 100
+
+def fetch_issue(jira_url, issue_key):
+    """Fetch summary and status for a single issue."""
+    response = SESSION.get(
+        f"{jira_url}/rest/api/3/issue/{issue_key}",
+        params={"fields": "summary,status"}
+    )
+    response.raise_for_status()
+    return loads(response.content)
+
+def print_created_details(jira_url, keys):
+    """Fetch the newly created issues in parallel and print them in order."""
+    print(f"\n⏳ Fetching details for {len(keys)} issue(s)...")
+    details, failures = batch_fetch(keys, lambda k: fetch_issue(jira_url, k), max_workers=10)
+    lines = []
+    for key in keys:
+        if key in details:
+            fields = details[key]['fields']
+            lines.append(f"  - {key}: {fields['summary']} [{fields['status']['name']}]")
+        else:
+            lines.append(f"  - {key}: ❌ {failures[key]}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
-    load_dotenv()
-    jira_url = os.getenv('JIRA_URL').rstrip('/')
-    email = os.getenv('JIRA_EMAIL')
-    api_token = os.getenv('JIRA_API_TOKEN')
+    jira_url = settings().jira_url
 
     project_key = input("Enter project key for bulk creation (e.g., KAN): ").strip().upper()
     prefix = input("Enter prefix for issue summaries: ").strip()
-    count = input("How many issues to create? (1-10): ").strip()
+    count = input(f"How many issues to create? (1-{MAX_ISSUES}): ").strip()
     
     try:
         count = int(count)
-        if not (1 <= count <= 10): raise ValueError
+        if not (1 <= count <= MAX_ISSUES): raise ValueError
     except ValueError:
         print("Invalid count. Using 2.")
         count = 2
@@ -40,30 +63,35 @@ def main():
             }
         })
 
-    payload = {"issueUpdates": issue_updates}
-
     print(f"\n⏳ Creating {count} issues in bulk...")
-    response = requests.post(
-        url,
-        auth=HTTPBasicAuth(email, api_token),
-        headers={"Content-Type": "application/json", "Accept": "application/json"},
-        json=payload
-    )
+    created, errors = [], []
+    accepted = False
+    for start in range(0, count, BULK_LIMIT):
+        payload = {"issueUpdates": issue_updates[start:start + BULK_LIMIT]}
+        response = SESSION.post(url, data=dumps(payload))
+
+        if response.status_code != 201:
+            print(f"❌ Bulk operation failed: {response.status_code}")
+            print(response.text)
+            break
+
+        accepted = True
+        result = loads(response.content)
+        created.extend(result.get('issues', []))
+        errors.extend(result.get('errors', []))
+
+    if accepted:
+        sys.stdout.write(
+            f"✅ Successfully created {len(created)} issue(s).\n"
+            + "".join(f"  - Created: {iss['key']}\n" for iss in created)
+        )
+
+    if errors:
+        print(f"⚠️  Encountered {len(errors)} error(s).")
 
-    if response.status_code == 201:
-        result = response.json()
-        created = result.get('issues', [])
-        errors = result.get('errors', [])
-        
-        print(f"✅ Successfully created {len(created)} issue(s).")
-        for iss in created:
-            print(f"  - Created: {iss['key']}")
-        
-        if errors:
-            print(f"⚠️  Encountered {len(errors)} error(s).")
-    else:
-        print(f"❌ Bulk operation failed: {response.status_code}")
-        print(response.text)
+    if created:
+        if input("\nFetch details for created issues? (y/n): ").strip().lower() == 'y':
+            print_created_details(jira_url, [iss['key'] for iss in created])
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,34 @@
+"""
+Jira Settings
+
+Loads the .env file once and exposes the Jira connection settings used by
+every script in this repo.
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from dotenv import load_dotenv
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Jira connection settings read from the environment / .env file."""
+    jira_url: str
+    email: str
+    api_token: str
+    cloud_id: str
+    domain: str
+
+
+@lru_cache(maxsize=1)
+def settings():
+    """Return the process-wide Settings, reading .env on first use only."""
+    load_dotenv()
+    return Settings(
+        jira_url=os.getenv('JIRA_URL', '').rstrip('/'),
+        email=os.getenv('JIRA_EMAIL', ''),
+        api_token=os.getenv('JIRA_API_TOKEN', ''),
+        cloud_id=os.getenv('CLOUD_ID', ''),
+        domain=os.getenv('DOMAIN', '')
+    )
@@ -14,25 +14,30 @@ Usage:
     py -3.13 createNewIssue.py
 """
 
-import os
 import json
+import threading
 import requests
-from requests.auth import HTTPBasicAuth
-from dotenv import load_dotenv
+from config import settings
+from jira_http import SESSION, adf_doc, disk_cache, dumps, loads
+
+# Used when the priority list cannot be fetched from the server
+DEFAULT_PRIORITIES = ["Highest", "High", "Medium", "Low", "Lowest"]
+
+# Seconds to wait at step 4 for the background priority fetch
+PRIORITY_WAIT = 5
+
+BANNER = "=" * 70
+SECTION_RULE = "-" * 70
 
 
 def print_header(text):
     """Print a formatted header."""
-    print("\n" + "="*70)
-    print(text.center(70))
-    print("="*70 + "\n")
+    print(f"\n{BANNER}\n{text.center(70)}\n{BANNER}\n")
 
 
 def print_section(text):
     """Print a formatted section header."""
-    print("\n" + "-"*70)
-    print(text)
-    print("-"*70)
+    print(f"\n{SECTION_RULE}\n{text}\n{SECTION_RULE}")
 
 
 def get_input(prompt, default=None, required=True):
@@ -82,51 +87,63 @@ def get_yes_no(prompt, default=True):
             print("⚠️  Please enter 'y' or 'n'")
 
 
-def get_projects(base_url, email, api_token):
-    """Fetch available projects from Jira."""
-    url = f"{base_url}/rest/api/3/project"
-    response = requests.get(
-        url,
-        auth=HTTPBasicAuth(email, api_token),
-        headers={"Accept": "application/json"}
-    )
+@disk_cache()
+def get_projects(base_url):
+    """Fetch available projects from Jira, including their issue types."""
+    url = f"{base_url}/rest/api/3/project/search"
+    projects = []
+    start_at = 0
     
-    if response.status_code == 200:
-        return response.json()
-    else:
-        print(f"⚠️  Warning: Could not fetch projects (Status: {response.status_code})")
-        return []
+    while True:
+        response = SESSION.get(
+            url,
+            params={"expand": "issueTypes", "startAt": start_at, "maxResults": 50}
+        )
+        
+        if response.status_code != 200:
+            print(f"⚠️  Warning: Could not fetch projects (Status: {response.status_code})")
+            return []
+        
+        page = loads(response.content)
+        values = page.get('values', [])
+        projects.extend(values)
+        
+        if page.get('isLast', True) or not values:
+            return projects
+        start_at += len(values)
 
 
-def get_issue_types(base_url, email, api_token, project_key):
-    """Fetch available issue types for a project."""
+@disk_cache()
+def get_issue_types(base_url, project_key):
+    """Fetch available issue types for a project (fallback for older servers)."""
     url = f"{base_url}/rest/api/3/project/{project_key}"
-    response = requests.get(
-        url,
-        auth=HTTPBasicAuth(email, api_token),
-        headers={"Accept": "application/json"}
-    )
+    response = SESSION.get(url)
     
     if response.status_code == 200:
-        project_data = response.json()
+        project_data = loads(response.content)
         return project_data.get('issueTypes', [])
     else:
         return []
 
 
-def create_issue(base_url, email, api_token, issue_data):
+def get_priorities(base_url):
+    """Fetch the names of the priorities configured in Jira; [] on any failure."""
+    url = f"{base_url}/rest/api/3/priority/search"
+    try:
+        response = SESSION.get(url, params={"maxResults": 50})
+        if response.status_code == 200:
+            return [p['name'] for p in loads(response.content).get('values', [])]
+    except (requests.RequestException, ValueError, KeyError):
+        # Runs in the background; never let it abort the form the user is filling in
+        pass
+    return []
+
+
+def create_issue(base_url, issue_data):
     """Create a new issue in Jira."""
     url = f"{base_url}/rest/api/3/issue"
     
-    response = requests.post(
-        url,
-        auth=HTTPBasicAuth(email, api_token),
-        headers={
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        },
-        json=issue_data
-    )
+    response = SESSION.post(url, data=dumps(issue_data))
     
     return response
 
@@ -136,46 +153,21 @@ def build_description_adf(text):
     if not text:
         return None
     
-    # Split by newlines to create paragraphs
-    paragraphs = text.split('\n')
-    content = []
-    
-    for para in paragraphs:
-        if para.strip():
-            content.append({
-                "type": "paragraph",
-                "content": [
-                    {
-                        "type": "text",
-                        "text": para
-                    }
-                ]
-            })
-    
-    if not content:
-        return None
+    # One paragraph per non-blank line
+    paragraphs = [para for para in text.split('\n') if para.strip()]
     
-    return {
-        "type": "doc",
-        "version": 1,
-        "content": content
-    }
+    return adf_doc(*paragraphs) if paragraphs else None
 
 
 def main():
     """Main function for interactive issue creation."""
     
-    # Load environment variables
-    load_dotenv()
-    
     print_header("🎫 JIRA ISSUE CREATOR 🎫")
     
     # Get credentials from environment
-    jira_url = os.getenv('JIRA_URL')
-    email = os.getenv('JIRA_EMAIL')
-    api_token = os.getenv('JIRA_API_TOKEN')
+    s = settings()
     
-    if not all([jira_url, email, api_token]):
+    if not all([s.jira_url, s.email, s.api_token]):
         print("❌ Error: Missing required environment variables in .env file!")
         print("\nPlease ensure your .env file contains:")
         print("  JIRA_URL=https://your-domain.atlassian.net")
@@ -183,12 +175,12 @@ def main():
         print("  JIRA_API_TOKEN=your-api-token")
         return
     
-    jira_url = jira_url.rstrip('/')
+    jira_url = s.jira_url
     print(f"📡 Connected to: {jira_url}\n")
     
     # Fetch available projects
     print("🔍 Fetching available spaces...")
-    projects = get_projects(jira_url, email, api_token)
+    projects = get_projects(jira_url)
     
     if not projects:
         print("❌ No spaces found. Please check your credentials.")
@@ -196,6 +188,14 @@ def main():
     
     print(f"✓ Found {len(projects)} space(s)")
     
+    # Fetch priorities in the background while the user fills in steps 1-3.
+    # A daemon thread so an early exit or Ctrl+C never waits on a slow server.
+    priorities = []
+    prefetch = threading.Thread(
+        target=lambda: priorities.extend(get_priorities(jira_url)), daemon=True
+    )
+    prefetch.start()
+    
     # Step 1: Select Project
     print_section("STEP 1: Select Space")
     
@@ -218,8 +218,12 @@ def main():
     # Step 2: Select Issue Type
     print_section("STEP 2: Select Issue Type")
     
-    print("\n🔍 Fetching issue types...")
-    issue_types = get_issue_types(jira_url, email, api_token, project_key)
+    # Issue types normally arrive with the project list; only servers that
+    # ignore expand=issueTypes need a second request
+    issue_types = selected_project.get('issueTypes')
+    if issue_types is None:
+        print("\n🔍 Fetching issue types...")
+        issue_types = get_issue_types(jira_url, project_key)
     
     if not issue_types:
         print("⚠️  Could not fetch issue types. Using default 'Task'")
@@ -246,15 +250,11 @@ def main():
     
     print("\nIssue description (press Enter twice to finish, or just Enter to skip):")
     description_lines = []
-    empty_line_count = 0
+    line = input()
     
-    while empty_line_count < 1:
+    while line.strip():
+        description_lines.append(line)
         line = input()
-        if line.strip():
-            description_lines.append(line)
-            empty_line_count = 0
-        else:
-            empty_line_count += 1
     
     description_text = '\n'.join(description_lines).strip()
     description_adf = build_description_adf(description_text) if description_text else None
@@ -266,10 +266,8 @@ def main():
     priority_name = None
     
     if set_priority:
-        priority_name = get_choice(
-            "Select priority:",
-            ["Highest", "High", "Medium", "Low", "Lowest"]
-        )
+        prefetch.join(timeout=PRIORITY_WAIT)
+        priority_name = get_choice("Select priority:", list(priorities) or DEFAULT_PRIORITIES)
         print(f"✓ Priority: {priority_name}")
     
     # Step 5: Labels (optional)
@@ -335,10 +333,10 @@ def main():
     # Create the issue
     print("\n⏳ Creating issue...")
     
-    response = create_issue(jira_url, email, api_token, issue_payload)
+    response = create_issue(jira_url, issue_payload)
     
     if response.status_code == 201:
-        result = response.json()
+        result = loads(response.content)
         issue_key = result.get('key')
         issue_id = result.get('id')
         issue_url = f"{jira_url}/browse/{issue_key}"
@@ -350,17 +348,20 @@ def main():
         print(f"  URL: {issue_url}")
         print(f"\n🔗 View in Jira: {issue_url}")
     else:
+        # The cached space or issue type may be stale; refetch next time
+        if response.status_code in (400, 401, 404):
+            get_projects.invalidate(jira_url)
+            get_issue_types.invalidate(jira_url, project_key)
+        
         print(f"\n❌ Failed to create issue (Status: {response.status_code})")
         print(f"\nError response:")
         try:
-            error_data = response.json()
+            error_data = loads(response.content)
             print(json.dumps(error_data, indent=2))
         except:
             print(response.text[:500])
     
-    print("\n" + "="*70)
-    print("Thank you for using the Jira Issue Creator!".center(70))
-    print("="*70 + "\n")
+    print_header("Thank you for using the Jira Issue Creator!")
 
 
 if __name__ == "__main__":
@@ -1,42 +1,16 @@
-import os
-import requests
-from dotenv import load_dotenv
+import argparse
+from config import settings
+from jira_cli import read_keys, reads_stdin
+from jira_http import SESSION, batch_fetch
 
-# Load environment variables from .env file
-load_dotenv()
-EMAIL = os.getenv('JIRA_EMAIL')
-API_TOKEN = os.getenv('JIRA_API_TOKEN')
-DOMAIN = os.getenv('DOMAIN')
-
-def delete_jira_issue():
-    # Prompt user for the issue code (e.g., DG-4)
-    issue_key = input("Enter the issue key to delete (e.g., KAN-1): ").strip()
-
-    if not issue_key:
-        print("Error: No issue key provided.")
-        return
+DOMAIN = settings().domain
 
+def delete_issue(issue_key):
     # Construct the Jira REST API v3 URL for the specific issue
     url = f"https://{DOMAIN}.atlassian.net/rest/api/3/issue/{issue_key}"
+    return SESSION.delete(url)
 
-    headers = {
-        "Accept": "application/json"
-    }
-
-    # Confirm before deleting (Safety step)
-    confirm = input(f"Are you sure you want to delete {issue_key}? (y/n): ")
-    if confirm.lower() != 'y':
-        print("Deletion cancelled.")
-        return
-
-    # Perform the DELETE request
-    response = requests.request(
-        "DELETE",
-        url,
-        headers=headers,
-        auth=(EMAIL, API_TOKEN)
-    )
-
+def report(issue_key, response):
     # Handle the response
     if response.status_code == 204:
         print(f"Successfully deleted issue {issue_key}.")
@@ -45,8 +19,42 @@ def delete_jira_issue():
     elif response.status_code == 401:
         print("Error: Authentication failed. Check your API token.")
     else:
-        print(f"Failed to delete issue. Status Code: {response.status_code}")
+        print(f"Failed to delete issue {issue_key}. Status Code: {response.status_code}")
         print(response.text)
 
+def delete_jira_issue():
+    parser = argparse.ArgumentParser(description="Delete one or more Jira issues.")
+    parser.add_argument("keys", nargs="*", help="Issue keys to delete (e.g., KAN-1); \"-\" or a pipe reads them from stdin")
+    parser.add_argument("-y", "--yes", action="store_true", help="Skip the confirmation prompt")
+    args = parser.parse_args()
+
+    issue_keys = read_keys(args.keys, parser)
+    if not issue_keys:
+        # Prompt user for the issue code (e.g., DG-4)
+        issue_key = input("Enter the issue key to delete (e.g., KAN-1): ").strip()
+        if not issue_key:
+            print("Error: No issue key provided.")
+            return
+        issue_keys = [issue_key]
+
+    # Confirm before deleting (Safety step)
+    if not args.yes:
+        if reads_stdin(args.keys):
+            print("Error: Keys were read from stdin; pass --yes to confirm deletion.")
+            return
+        confirm = input(f"Are you sure you want to delete {', '.join(issue_keys)}? (y/n): ")
+        if confirm.lower() != 'y':
+            print("Deletion cancelled.")
+            return
+
+    # Perform the DELETE requests in parallel over the shared session
+    responses, errors = batch_fetch(issue_keys, delete_issue, max_workers=8)
+
+    for issue_key in issue_keys:
+        if issue_key in errors:
+            print(f"Failed to delete issue {issue_key}: {errors[issue_key]}")
+        else:
+            report(issue_key, responses[issue_key])
+
 if __name__ == "__main__":
-    delete_jira_issue()
\ No newline at end of file
+    delete_jira_issue()
@@ -2,76 +2,90 @@
 """
 Jira Issue Details Fetcher
 
-Retrieve and display details for a specific Jira issue.
+Retrieve and display details for one or more Jira issues.
+
+Usage:
+    python getIssue.py                  # prompts for a key
+    python getIssue.py KAN-1 KAN-2      # fetches several keys in parallel
+    cat keys.txt | python getIssue.py -
 """
 
-import os
+import sys
 import json
-import requests
-from requests.auth import HTTPBasicAuth
-from dotenv import load_dotenv
+import argparse
+from config import settings
+from jira_cli import read_keys
+from jira_http import SESSION, batch_fetch, loads
 
-def print_header(text):
-    print("\n" + "="*70)
-    print(text.center(70))
-    print("="*70 + "\n")
+# Only the fields printed below are requested from the server
+ISSUE_FIELDS = "summary,status,project,issuetype,assignee,creator,description"
 
-def main():
-    load_dotenv()
-    
-    jira_url = os.getenv('JIRA_URL')
-    email = os.getenv('JIRA_EMAIL')
-    api_token = os.getenv('JIRA_API_TOKEN')
-    
-    if not all([jira_url, email, api_token]):
-        print("❌ Error: Missing required environment variables!")
-        return
+BANNER = "=" * 70
 
-    jira_url = jira_url.rstrip('/')
-    print_header("📄 JIRA ISSUE DETAILS")
-    
-    issue_key = input("Enter issue key (e.g., KAN-1): ").strip().upper()
-    if not issue_key:
-        print("❌ Error: Issue key is required.")
-        return
+def print_header(text):
+    print(f"\n{BANNER}\n{text.center(70)}\n{BANNER}\n")
 
+def fetch_issue(jira_url, issue_key):
+    """Fetch the displayed fields of a single issue."""
     url = f"{jira_url}/rest/api/3/issue/{issue_key}"
+    return SESSION.get(url, params={"fields": ISSUE_FIELDS})
 
-    print(f"\n⏳ Fetching details for {issue_key}...")
-    response = requests.get(
-        url,
-        auth=HTTPBasicAuth(email, api_token),
-        headers={"Accept": "application/json"}
-    )
-
+def print_issue(jira_url, issue_key, response):
+    """Print the details of a fetched issue, or why it could not be fetched."""
     if response.status_code == 200:
-        issue = response.json()
+        issue = loads(response.content)
         fields = issue['fields']
-        
-        print(f"\n✅ {issue['key']}: {fields['summary']}")
-        print(f"Status: {fields['status']['name']}")
-        print(f"Project: {fields['project']['name']} ({fields['project']['key']})")
-        print(f"Issue Type: {fields['issuetype']['name']}")
-        
         assignee = fields.get('assignee')
-        print(f"Assignee: {assignee['displayName'] if assignee else 'Unassigned'}")
-        
         creator = fields.get('creator')
-        print(f"Creator: {creator['displayName'] if creator else 'Unknown'}")
-        
-        print("\nDescription:")
         # Description is in ADF format, we'll just show the raw text for simplicity or a message
         desc = fields.get('description')
-        if desc:
-            print("  [ADF Content Available]")
-        else:
-            print("  (No description)")
-            
-        print(f"\nURL: {jira_url}/browse/{issue_key}")
+        
+        sys.stdout.write(
+            f"\n✅ {issue['key']}: {fields['summary']}\n"
+            f"Status: {fields['status']['name']}\n"
+            f"Project: {fields['project']['name']} ({fields['project']['key']})\n"
+            f"Issue Type: {fields['issuetype']['name']}\n"
+            f"Assignee: {assignee['displayName'] if assignee else 'Unassigned'}\n"
+            f"Creator: {creator['displayName'] if creator else 'Unknown'}\n"
+            "\nDescription:\n"
+            f"{'  [ADF Content Available]' if desc else '  (No description)'}\n"
+            f"\nURL: {jira_url}/browse/{issue_key}\n"
+        )
     else:
         print(f"❌ Failed to fetch issue (Status: {response.status_code})")
         if response.status_code == 404:
             print(f"Result: Issue {issue_key} not found.")
 
+def main():
+    parser = argparse.ArgumentParser(description="Retrieve Jira issue details.")
+    parser.add_argument("keys", nargs="*", help="Issue keys (e.g., KAN-1); \"-\" or a pipe reads them from stdin")
+    args = parser.parse_args()
+
+    s = settings()
+    
+    if not all([s.jira_url, s.email, s.api_token]):
+        print("❌ Error: Missing required environment variables!")
+        return
+
+    jira_url = s.jira_url
+    print_header("📄 JIRA ISSUE DETAILS")
+    
+    issue_keys = read_keys(args.keys, parser)
+    if not issue_keys:
+        issue_key = input("Enter issue key (e.g., KAN-1): ").strip().upper()
+        if not issue_key:
+            print("❌ Error: Issue key is required.")
+            return
+        issue_keys = [issue_key]
+
+    print(f"\n⏳ Fetching details for {', '.join(issue_keys)}...")
+    responses, errors = batch_fetch(issue_keys, lambda k: fetch_issue(jira_url, k), max_workers=8)
+
+    for issue_key in issue_keys:
+        if issue_key in errors:
+            print(f"❌ Failed to fetch {issue_key}: {errors[issue_key]}")
+        else:
+            print_issue(jira_url, issue_key, responses[issue_key])
+
 if __name__ == "__main__":
     main()
@@ -5,40 +5,41 @@ Jira User Searcher
 Search for Jira users by name or email.
 """
 
-import os
-import requests
-from requests.auth import HTTPBasicAuth
-from dotenv import load_dotenv
+import sys
+from config import settings
+from jira_http import SESSION, loads
+
+# Jira's maximum page size for user search (the default is 50)
+MAX_RESULTS = 1000
+
+# Not disk-cached: results carry email addresses and account IDs
+def search_users(jira_url, query):
+    """Search users by name or email; returns None if the request fails."""
+    url = f"{jira_url}/rest/api/3/user/search"
+    response = SESSION.get(url, params={"query": query, "maxResults": MAX_RESULTS})
+
+    if response.status_code == 200:
+        return loads(response.content)
+    print(f"❌ Failed to search users (Status: {response.status_code})")
+    return None
 
 def main():
-    load_dotenv()
-    jira_url = os.getenv('JIRA_URL').rstrip('/')
-    email = os.getenv('JIRA_EMAIL')
-    api_token = os.getenv('JIRA_API_TOKEN')
+    jira_url = settings().jira_url
 
     query = input("Enter search query (name or email): ").strip()
     if not query: return
 
-    url = f"{jira_url}/rest/api/3/user/search"
-    params = {"query": query}
-    
-    response = requests.get(
-        url,
-        auth=HTTPBasicAuth(email, api_token),
-        headers={"Accept": "application/json"},
-        params=params
-    )
+    users = search_users(jira_url, query)
 
-    if response.status_code == 200:
-        users = response.json()
-        print(f"\n✅ Found {len(users)} user(s):")
+    if users is not None:
+        # Build the whole listing first and write it in one call
+        lines = [f"\n✅ Found {len(users)} user(s):"]
         for u in users:
-            print(f"- {u['displayName']} ({u.get('emailAddress', 'Hidden Email')})")
-            print(f"  Account ID: {u['accountId']}")
-            print(f"  Active: {u['active']}")
-            print("-" * 30)
-    else:
-        print(f"❌ Failed to search users (Status: {response.status_code})")
+            lines.append(f"- {u['displayName']} ({u.get('emailAddress', 'Hidden Email')})")
+            lines.append(f"  Account ID: {u['accountId']}")
+            lines.append(f"  Active: {u['active']}")
+            lines.append("-" * 30)
+        sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     main()
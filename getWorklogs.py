@@ -2,33 +2,63 @@
 """
 Jira Issue Worklog Fetcher
 
-Retrieve worklogs for a specific Jira issue.
+Retrieve worklogs for one or more Jira issues.
+
+Usage:
+    python getWorklogs.py               # prompts for a key
+    python getWorklogs.py KAN-1 KAN-2   # fetches several keys in parallel
 """
 
-import os
-import requests
-from requests.auth import HTTPBasicAuth
-from dotenv import load_dotenv
+import argparse
+from config import settings
+from jira_cli import read_keys
+from jira_http import POOL_MAXSIZE, SESSION, batch_fetch, loads
 
-def main():
-    load_dotenv()
-    jira_url = os.getenv('JIRA_URL').rstrip('/')
-    email = os.getenv('JIRA_EMAIL')
-    api_token = os.getenv('JIRA_API_TOKEN')
+PAGE_SIZE = 1000
+
+# Issues fetched in parallel; their page fetches share what is left of the pool
+MAX_ISSUE_WORKERS = 8
 
-    issue_key = input("Enter issue key (e.g., KAN-1): ").strip().upper()
-    if not issue_key: return
+def fetch_page(url, start_at):
+    """Fetch one page of worklogs starting at the given offset."""
+    response = SESSION.get(url, params={"startAt": start_at, "maxResults": PAGE_SIZE})
+    response.raise_for_status()
+    return loads(response.content)
 
+def fetch_worklogs(jira_url, issue_key, max_workers=5):
+    """
+    Fetch every worklog of an issue, using up to max_workers page fetches.
+
+    Returns (status_code, worklogs, missing_pages).
+    """
     url = f"{jira_url}/rest/api/3/issue/{issue_key}/worklog"
-    
-    response = requests.get(
-        url,
-        auth=HTTPBasicAuth(email, api_token),
-        headers={"Accept": "application/json"}
-    )
 
-    if response.status_code == 200:
-        worklogs = response.json().get('worklogs', [])
+    response = SESSION.get(url, params={"startAt": 0, "maxResults": PAGE_SIZE})
+    if response.status_code != 200:
+        return response.status_code, [], 0
+
+    first_page = loads(response.content)
+    worklogs = first_page.get('worklogs', [])
+    total = first_page.get('total', len(worklogs))
+
+    # The first page tells us the total and the page size the server
+    # actually honoured; fetch the remaining pages concurrently
+    step = len(worklogs)
+    starts = list(range(step, total, step)) if step else []
+    failures = {}
+    if starts:
+        pages, failures = batch_fetch(starts, lambda s: fetch_page(url, s), max_workers)
+        for start in starts:
+            worklogs.extend(pages.get(start, {}).get('worklogs', []))
+
+    return response.status_code, worklogs, len(failures)
+
+def print_worklogs(issue_key, status_code, worklogs, missing_pages):
+    """Print the worklogs of a single issue."""
+    if status_code == 200:
+        if missing_pages:
+            print(f"⚠️  Could not fetch {missing_pages} page(s); results are incomplete.")
+
         print(f"\n✅ Found {len(worklogs)} worklog(s) for {issue_key}:")
         for wl in worklogs:
             author = wl.get('author', {}).get('displayName', 'Unknown')
@@ -38,7 +68,33 @@ def main():
             if wl.get('comment'):
                 print(f"  Comment: {wl['comment']}")
     else:
-        print(f"❌ Failed to fetch worklogs (Status: {response.status_code})")
+        print(f"❌ Failed to fetch worklogs for {issue_key} (Status: {status_code})")
+
+def main():
+    parser = argparse.ArgumentParser(description="Retrieve Jira issue worklogs.")
+    parser.add_argument("keys", nargs="*", help="Issue keys (e.g., KAN-1); \"-\" or a pipe reads them from stdin")
+    args = parser.parse_args()
+
+    jira_url = settings().jira_url
+
+    issue_keys = read_keys(args.keys, parser)
+    if not issue_keys:
+        issue_key = input("Enter issue key (e.g., KAN-1): ").strip().upper()
+        if not issue_key: return
+        issue_keys = [issue_key]
+
+    # Keep issues x pages within the connection pool so no socket is discarded
+    issue_workers = min(MAX_ISSUE_WORKERS, len(issue_keys))
+    page_workers = max(1, POOL_MAXSIZE // issue_workers)
+    results, errors = batch_fetch(
+        issue_keys, lambda k: fetch_worklogs(jira_url, k, page_workers), max_workers=issue_workers
+    )
+
+    for issue_key in issue_keys:
+        if issue_key in errors:
+            print(f"❌ Failed to fetch worklogs for {issue_key}: {errors[issue_key]}")
+        else:
+            print_worklogs(issue_key, *results[issue_key])
 
 if __name__ == "__main__":
     main()
@@ -12,19 +12,11 @@ Usage:
     python get_automation_rules.py
 """
 
-import os
-import json
-import requests
-from requests.auth import HTTPBasicAuth
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+from config import settings
+from jira_http import SESSION, dumps, loads
 
 # Configuration
-JIRA_EMAIL = os.getenv('JIRA_EMAIL')
-JIRA_API_TOKEN = os.getenv('JIRA_API_TOKEN')
-CLOUD_ID=os.getenv('CLOUD_ID')
+CLOUD_ID = settings().cloud_id
 PROTOCOL = 'https'
 HOST = 'api.atlassian.com'
 
@@ -32,23 +24,19 @@ HOST = 'api.atlassian.com'
 url = f"{PROTOCOL}://{HOST}/automation/public/jira/{CLOUD_ID}/rest/v1/rule/summary"
 
 # Make GET request
-response = requests.get(
-    url,
-    headers={"Accept": "application/json"},
-    auth=HTTPBasicAuth(JIRA_EMAIL, JIRA_API_TOKEN)
-)
+response = SESSION.get(url)
 
 # Remove PII from output files
-data=response.json()
-keys_to_remove = ["authorAccountId", "actorAccountId", "ruleScopeARIs"]
+data = loads(response.content)
+keys_to_remove = ("authorAccountId", "actorAccountId", "ruleScopeARIs")
 for item in data['data']:
     for key in keys_to_remove:
-        item.pop(key,None)
+        item.pop(key, None)
 
 # Save response to JSON file
 output_file = f"all_automation_rules.json"
-with open(output_file, 'w', encoding='utf-8') as f:
-    json.dump(data, f, indent=2)
+with open(output_file, 'wb') as f:
+    f.write(dumps(data, pretty=True))
 
 print(f"✅ Saved to {output_file}")
 print(f"Status: {response.status_code}")
@@ -0,0 +1,62 @@
+"""
+Jira CLI Helpers
+
+Command-line helpers shared by the scripts that take issue keys.
+
+Keys come from argv, or from stdin when "-" is passed. With no keys at all,
+stdin is also read when it is clearly piped or redirected. On Windows a
+console such as mintty/Git Bash cannot be told apart from a pipe, so there
+the scripts refuse to guess and ask for "-" instead of prompting.
+"""
+
+import os
+import sys
+import stat
+
+
+def stdin_mode():
+    """Return the st_mode of stdin, or None when it is a console or unknown."""
+    if sys.stdin is None or sys.stdin.isatty():
+        return None
+    try:
+        return os.fstat(sys.stdin.fileno()).st_mode
+    except (OSError, ValueError):
+        return None
+
+
+def stdin_is_piped():
+    """True when stdin is a pipe or redirected file rather than a console."""
+    mode = stdin_mode()
+    if mode is None:
+        return False
+    if os.name == 'nt':
+        # mintty/Git Bash consoles show up as pipes to native Windows Python
+        return stat.S_ISREG(mode)
+    return stat.S_ISFIFO(mode) or stat.S_ISREG(mode)
+
+
+def stdin_is_ambiguous():
+    """True when stdin may be a pipe but could also be a Windows console."""
+    mode = stdin_mode()
+    return os.name == 'nt' and mode is not None and stat.S_ISFIFO(mode)
+
+
+def reads_stdin(keys):
+    """True when read_keys(keys, parser) will take its keys from stdin."""
+    return '-' in keys or (not keys and stdin_is_piped())
+
+
+def read_keys(keys, parser):
+    """
+    Normalise and de-duplicate issue keys from argv, keeping their order.
+
+    A "-" argument reads further keys from stdin; with no arguments at all,
+    keys are read from stdin when it is piped. Exits through parser.error
+    when stdin looks like a Windows pipe, since prompting would only read
+    its first line.
+    """
+    if not keys and stdin_is_ambiguous():
+        parser.error("stdin is not a console; pass '-' to read issue keys from it")
+    if reads_stdin(keys):
+        keys = [key for key in keys if key != '-'] + sys.stdin.read().split()
+    return list(dict.fromkeys(key.strip().upper() for key in keys if key.strip()))
@@ -0,0 +1,220 @@
+"""
+Jira HTTP Session
+
+Shared, authenticated requests.Session used by the scripts in this repo.
+Every REST call made through SESSION reuses the same pooled connection,
+so only the first request pays for the TCP + TLS handshake.
+
+JSON bodies are encoded and decoded with orjson when it is installed
+(pip install orjson) and with the standard json module otherwise.
+Brotli-compressed responses are requested when brotli is installed
+(pip install brotli); gzip is always accepted.
+
+Slow-changing lookups can be wrapped in @disk_cache() so repeated runs
+within a few minutes are served from ~/.cache/jira-cli/ instead of Jira.
+"""
+
+import os
+import json
+import time
+import base64
+import hashlib
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+from urllib3.util.retry import Retry
+from config import settings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli  # noqa: F401 - lets urllib3 decode "br" responses
+    ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+# (connect, read) seconds, applied to every request that doesn't set its own
+DEFAULT_TIMEOUT = (5, 30)
+
+class RateLimitRetry(Retry):
+    """
+    Retry that also retries POST, but only on 429 Too Many Requests.
+
+    A 429 means the server did not process the request, so resending is
+    safe even for issue/comment creation; a 5xx on POST may have been
+    applied and is returned to the caller instead.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method and method.upper() == "POST" and status_code == 429:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+# Transient failures are retried with exponential backoff, honouring
+# Retry-After on 429. 5xx responses are only retried for idempotent methods;
+# POST (search/jql, creation) is retried on 429 alone. raise_on_status=False
+# hands the last response back to the scripts so they can report the status
+# code as usual.
+RETRY = RateLimitRetry(
+    total=5,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "PUT", "DELETE"]),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "jira-cli")
+CACHE_TTL = 300
+
+# Basic auth header encoded once instead of on every request
+AUTH_HEADER = "Basic " + base64.b64encode(
+    f"{settings().email}:{settings().api_token}".encode()
+).decode()
+
+
+class HeaderAuth(AuthBase):
+    """
+    Attach the precomputed AUTH_HEADER to every request.
+
+    Installed as SESSION.auth so requests never falls back to ~/.netrc,
+    whose entry for the host would otherwise replace the .env credentials.
+    """
+
+    def __init__(self, header):
+        self.header = header
+
+    def __call__(self, request):
+        request.headers['Authorization'] = self.header
+        return request
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that falls back to DEFAULT_TIMEOUT instead of waiting forever."""
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = DEFAULT_TIMEOUT
+        return super().send(request, **kwargs)
+
+
+SESSION = requests.Session()
+SESSION.auth = HeaderAuth(AUTH_HEADER)
+SESSION.headers.update({
+    "Accept": "application/json",
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Content-Type": "application/json"
+})
+ADAPTER = TimeoutHTTPAdapter(
+    pool_connections=POOL_CONNECTIONS,
+    pool_maxsize=POOL_MAXSIZE,
+    max_retries=RETRY
+)
+SESSION.mount("https://", ADAPTER)
+SESSION.mount("http://", ADAPTER)
+
+
+def loads(body):
+    """Decode a JSON response body (bytes) into Python objects."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def dumps(obj, pretty=False):
+    """Encode obj to JSON bytes, indented by two spaces when pretty is set."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(obj, indent=2 if pretty else None).encode('utf-8')
+
+
+def adf_doc(*paragraphs):
+    """Wrap plain-text paragraphs in an Atlassian Document Format document."""
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {"type": "paragraph", "content": [{"type": "text", "text": text}]}
+            for text in paragraphs
+        ]
+    }
+
+
+def batch_fetch(keys, fn, max_workers=5):
+    """
+    Run fn(key) for every key concurrently over the shared SESSION.
+
+    Returns a (results, errors) pair of dicts keyed by the input key. The
+    worker count is capped at POOL_MAXSIZE so threads never wait on the
+    connection pool.
+    """
+    results, errors = {}, {}
+    workers = max(1, min(max_workers, POOL_MAXSIZE, len(keys)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(fn, key): key for key in keys}
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                errors[key] = e
+    return results, errors
+
+
+def disk_cache(ttl=CACHE_TTL):
+    """
+    Cache a function's JSON-serialisable result on disk for ttl seconds.
+
+    Entries are keyed on the function name, its arguments and the configured
+    account. Empty results (what the fetch helpers return on 401/404) are
+    never stored, and fn.invalidate(*args) drops a single entry. The cache
+    directory and files are private to the current user, and expired
+    entries are deleted when they are next read.
+    """
+    def decorator(fn):
+        def cache_path(args):
+            key = repr((settings().email, args)).encode()
+            return os.path.join(CACHE_DIR, f"{fn.__name__}-{hashlib.sha1(key).hexdigest()}.json")
+
+        @functools.wraps(fn)
+        def wrapper(*args):
+            path = cache_path(args)
+            try:
+                with open(path, 'rb') as f:
+                    entry = loads(f.read())
+                if time.time() < entry['expires']:
+                    return entry['value']
+                os.remove(path)
+            except (OSError, ValueError, KeyError):
+                pass
+
+            value = fn(*args)
+            if value:
+                try:
+                    os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+                    os.chmod(CACHE_DIR, 0o700)  # tighten a directory made by older versions
+                    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                    with os.fdopen(fd, 'wb') as f:
+                        f.write(dumps({"expires": time.time() + ttl, "value": value}))
+                except OSError:
+                    pass
+            return value
+
+        def invalidate(*args):
+            try:
+                os.remove(cache_path(args))
+            except OSError:
+                pass
+
+        wrapper.invalidate = invalidate
+        return wrapper
+    return decorator
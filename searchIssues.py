@@ -3,75 +3,113 @@
 Jira Issue Searcher
 
 Search for issues using JQL (Jira Query Language).
+
+Usage:
+    python searchIssues.py                                # interactive
+    python searchIssues.py --jql "project = KAN AND status = 'To Do'"
+    python searchIssues.py --jql "project = KAN" --max-results 500 --fields summary,status
 """
 
-import os
 import json
+import argparse
+from itertools import islice
 import requests
-from requests.auth import HTTPBasicAuth
-from dotenv import load_dotenv
+from config import settings
+from jira_http import SESSION, dumps, loads
+
+# Fields shown for each result
+SEARCH_FIELDS = ["summary", "status", "issuetype", "assignee"]
+
+# Number of results shown
+MAX_RESULTS = 10
+
+# Largest page the search/jql endpoint returns for a full field list
+PAGE_LIMIT = 100
+
+BANNER = "=" * 70
 
 def print_header(text):
-    print("\n" + "="*70)
-    print(text.center(70))
-    print("="*70 + "\n")
+    print(f"\n{BANNER}\n{text.center(70)}\n{BANNER}\n")
+
+def iter_issues(jira_url, jql, batch_size=PAGE_LIMIT, fields=SEARCH_FIELDS):
+    """
+    Yield every issue matching jql, fetching batch_size issues per request.
+
+    Uses the cursor-based /rest/api/3/search/jql endpoint, following
+    nextPageToken until the server reports the last page. Raises
+    requests.HTTPError if a page cannot be fetched.
+    """
+    url = f"{jira_url}/rest/api/3/search/jql"
+    payload = {"jql": jql, "maxResults": batch_size, "fields": fields}
+    warned = False
+
+    while True:
+        response = SESSION.post(url, data=dumps(payload))
+        response.raise_for_status()
+        data = loads(response.content)
+        issues = data.get('issues', [])
+        yield from issues
+
+        next_token = data.get('nextPageToken')
+        if data.get('isLast', True) or not next_token:
+            return
+
+        if len(issues) < batch_size and not warned:
+            print(f"⚠️  Server capped page size at {len(issues)}; continuing with smaller pages.")
+            warned = True
+        payload["nextPageToken"] = next_token
 
 def main():
-    load_dotenv()
-    
-    jira_url = os.getenv('JIRA_URL')
-    email = os.getenv('JIRA_EMAIL')
-    api_token = os.getenv('JIRA_API_TOKEN')
-    
-    if not all([jira_url, email, api_token]):
+    parser = argparse.ArgumentParser(description="Search Jira issues with JQL.")
+    parser.add_argument("--jql", help="JQL query; prompts if omitted")
+    parser.add_argument("--max-results", type=int, default=MAX_RESULTS,
+                        help=f"Maximum number of issues to show (default: {MAX_RESULTS})")
+    parser.add_argument("--fields", default=",".join(SEARCH_FIELDS),
+                        help="Comma-separated fields to request (default: %(default)s)")
+    args = parser.parse_args()
+    if args.max_results < 1:
+        parser.error("--max-results must be at least 1")
+    fields = [f.strip() for f in args.fields.split(',') if f.strip()]
+
+    s = settings()
+
+    if not all([s.jira_url, s.email, s.api_token]):
         print("❌ Error: Missing required environment variables!")
         return
 
-    jira_url = jira_url.rstrip('/')
+    jira_url = s.jira_url
     print_header("🔍 JIRA ISSUE SEARCH")
-    
-    jql = input("Enter JQL query (e.g., project = 'KAN' AND status = 'To Do'): ").strip()
-    if not jql:
-        print("⚠️  Empty JQL. Searching for all issues...")
-        jql = "order by created DESC"
 
-    url = f"{jira_url}/rest/api/3/search"
-    
-    payload = {
-        "jql": jql,
-        "maxResults": 10,
-        "fields": ["summary", "status", "issuetype", "assignee"]
-    }
+    jql = args.jql if args.jql is not None else input("Enter JQL query (e.g., project = 'KAN' AND status = 'To Do'): ")
+    jql = jql.strip()
+    if not jql:
+        # The search/jql endpoint rejects unbounded queries
+        print("⚠️  Empty JQL. Searching for issues created in the last 30 days...")
+        jql = "created >= -30d order by created DESC"
 
     print("\n⏳ Searching...")
-    response = requests.post(
-        url,
-        auth=HTTPBasicAuth(email, api_token),
-        headers={"Accept": "application/json", "Content-Type": "application/json"},
-        json=payload
-    )
-
-    if response.status_code == 200:
-        data = response.json()
-        issues = data.get('issues', [])
-        total = data.get('total', 0)
-        
-        print(f"✓ Found {total} issue(s). Showing top {len(issues)}:\n")
-        
-        for issue in issues:
-            key = issue['key']
-            summary = issue['fields']['summary']
-            status = issue['fields']['status']['name']
-            itype = issue['fields']['issuetype']['name']
-            assignee = issue['fields'].get('assignee')
-            assignee_name = assignee['displayName'] if assignee else "Unassigned"
-            
-            print(f"[{key}] {summary}")
-            print(f"      Type: {itype} | Status: {status} | Assignee: {assignee_name}")
-            print("-" * 50)
-    else:
-        print(f"❌ Search failed (Status: {response.status_code})")
-        print(response.text)
+    try:
+        batch_size = min(args.max_results, PAGE_LIMIT)
+        issues = list(islice(iter_issues(jira_url, jql, batch_size, fields), args.max_results))
+    except requests.HTTPError as e:
+        print(f"❌ Search failed (Status: {e.response.status_code})")
+        print(e.response.text)
+        return
+
+    print(f"✓ Showing top {len(issues)} issue(s):\n")
+
+    for issue in issues:
+        key = issue['key']
+        values = issue.get('fields', {})
+        summary = values.get('summary', '')
+        status = (values.get('status') or {}).get('name', '-')
+        itype = (values.get('issuetype') or {}).get('name', '-')
+        assignee = values.get('assignee')
+        assignee_name = assignee['displayName'] if assignee else "Unassigned"
+
+        print(f"[{key}] {summary}")
+        print(f"      Type: {itype} | Status: {status} | Assignee: {assignee_name}")
+        print("-" * 50)
 
 if __name__ == "__main__":
     main()
@@ -3,54 +3,65 @@
 Jira Issue Transitioner
 
 Move an issue through its workflow.
+
+Usage:
+    python transitionIssue.py                                  # interactive
+    python transitionIssue.py --key KAN-1 --transition "In Progress"
 """
 
-import os
-import requests
-from requests.auth import HTTPBasicAuth
-from dotenv import load_dotenv
+import argparse
+from config import settings
+from jira_http import SESSION, dumps, loads
 
 def main():
-    load_dotenv()
-    jira_url = os.getenv('JIRA_URL').rstrip('/')
-    email = os.getenv('JIRA_EMAIL')
-    api_token = os.getenv('JIRA_API_TOKEN')
+    parser = argparse.ArgumentParser(description="Move a Jira issue through its workflow.")
+    parser.add_argument("--key", help="Issue key (e.g., KAN-1)")
+    parser.add_argument("--transition", help="Transition name or ID; prompts with a menu if omitted")
+    args = parser.parse_args()
+
+    jira_url = settings().jira_url
 
-    issue_key = input("Enter issue key to transition (e.g., KAN-1): ").strip().upper()
+    issue_key = (args.key or input("Enter issue key to transition (e.g., KAN-1): ")).strip().upper()
     if not issue_key: return
 
     # 1. Fetch available transitions
     trans_url = f"{jira_url}/rest/api/3/issue/{issue_key}/transitions"
-    response = requests.get(trans_url, auth=HTTPBasicAuth(email, api_token))
-    
+    response = SESSION.get(trans_url)
+
     if response.status_code != 200:
         print(f"❌ Failed to fetch transitions (Status: {response.status_code})")
         return
 
-    transitions = response.json().get('transitions', [])
+    transitions = loads(response.content).get('transitions', [])
     if not transitions:
         print("No transitions available for this issue.")
         return
 
-    print(f"\nAvailable transitions for {issue_key}:")
-    for idx, t in enumerate(transitions, 1):
-        print(f"  {idx}. {t['name']} (ID: {t['id']})")
+    if args.transition:
+        wanted = args.transition.strip().lower()
+        selected = next(
+            (t for t in transitions if t['id'] == wanted or t['name'].lower() == wanted),
+            None
+        )
+        if not selected:
+            names = ", ".join(t['name'] for t in transitions)
+            print(f"❌ Transition '{args.transition}' not available. Options: {names}")
+            return
+    else:
+        print(f"\nAvailable transitions for {issue_key}:")
+        for idx, t in enumerate(transitions, 1):
+            print(f"  {idx}. {t['name']} (ID: {t['id']})")
 
-    choice = input(f"\nSelect transition (1-{len(transitions)}): ").strip()
-    try:
-        selected = transitions[int(choice)-1]
-    except (ValueError, IndexError):
-        print("Invalid choice.")
-        return
+        choice = input(f"\nSelect transition (1-{len(transitions)}): ").strip()
+        try:
+            selected = transitions[int(choice)-1]
+        except (ValueError, IndexError):
+            print("Invalid choice.")
+            return
 
     # 2. Perform transition
     payload = {"transition": {"id": selected['id']}}
-    resp = requests.post(
-        trans_url,
-        auth=HTTPBasicAuth(email, api_token),
-        headers={"Content-Type": "application/json"},
-        json=payload
-    )
+    resp = SESSION.post(trans_url, data=dumps(payload))
 
     if resp.status_code == 204:
         print(f"✅ Issue {issue_key} transitioned to: {selected['name']}")
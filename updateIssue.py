@@ -3,65 +3,64 @@
 Jira Issue Updater
 
 Update fields of an existing Jira issue.
+
+Usage:
+    python updateIssue.py                                 # interactive
+    python updateIssue.py --key KAN-1 --summary "New title" --description "New text"
 """
 
-import os
 import json
-import requests
-from requests.auth import HTTPBasicAuth
-from dotenv import load_dotenv
+import argparse
+from config import settings
+from jira_http import SESSION, adf_doc, dumps
+
+BANNER = "=" * 70
 
 def print_header(text):
-    print("\n" + "="*70)
-    print(text.center(70))
-    print("="*70 + "\n")
+    print(f"\n{BANNER}\n{text.center(70)}\n{BANNER}\n")
 
 def main():
-    load_dotenv()
-    
-    jira_url = os.getenv('JIRA_URL')
-    email = os.getenv('JIRA_EMAIL')
-    api_token = os.getenv('JIRA_API_TOKEN')
+    parser = argparse.ArgumentParser(description="Update fields of a Jira issue.")
+    parser.add_argument("--key", help="Issue key (e.g., KAN-1)")
+    parser.add_argument("--summary", help="New summary")
+    parser.add_argument("--description", help="New description (plain text)")
+    args = parser.parse_args()
+
+    s = settings()
     
-    if not all([jira_url, email, api_token]):
+    if not all([s.jira_url, s.email, s.api_token]):
         print("❌ Error: Missing required environment variables!")
         return
 
-    jira_url = jira_url.rstrip('/')
+    jira_url = s.jira_url
     print_header("✏️ JIRA ISSUE UPDATER")
     
-    issue_key = input("Enter issue key to update (e.g., KAN-1): ").strip().upper()
+    issue_key = (args.key or input("Enter issue key to update (e.g., KAN-1): ")).strip().upper()
     if not issue_key:
         return
 
-    print("\nWhat would you like to update?")
-    print("1. Summary")
-    print("2. Description")
-    print("3. Both")
-    
-    choice = input("\nEnter choice (1-3): ").strip()
-    
+    summary, description = args.summary, args.description
+    if summary is None and description is None:
+        print("\nWhat would you like to update?")
+        print("1. Summary")
+        print("2. Description")
+        print("3. Both")
+
+        choice = input("\nEnter choice (1-3): ").strip()
+
+        if choice in ['1', '3']:
+            summary = input("Enter new summary: ")
+        if choice in ['2', '3']:
+            description = input("Enter new description: ")
+
     payload = {"fields": {}}
-    
-    if choice in ['1', '3']:
-        summary = input("Enter new summary: ").strip()
-        if summary:
-            payload["fields"]["summary"] = summary
-            
-    if choice in ['2', '3']:
-        description = input("Enter new description: ").strip()
-        if description:
-            # Simple ADF conversion for text
-            payload["fields"]["description"] = {
-                "type": "doc",
-                "version": 1,
-                "content": [
-                    {
-                        "type": "paragraph",
-                        "content": [{"type": "text", "text": description}]
-                    }
-                ]
-            }
+
+    if summary and summary.strip():
+        payload["fields"]["summary"] = summary.strip()
+
+    if description and description.strip():
+        # Simple ADF conversion for text
+        payload["fields"]["description"] = adf_doc(description.strip())
 
     if not payload["fields"]:
         print("⚠️  No changes specified.")
@@ -70,15 +69,7 @@ def main():
     url = f"{jira_url}/rest/api/3/issue/{issue_key}"
 
     print(f"\n⏳ Updating {issue_key}...")
-    response = requests.put(
-        url,
-        auth=HTTPBasicAuth(email, api_token),
-        headers={
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        },
-        json=payload
-    )
+    response = SESSION.put(url, data=dumps(payload))
 
     if response.status_code == 204:
         print(f"✅ Successfully updated {issue_key}!")